@@ -1,210 +1,333 @@
 """Generate a 3-page DOCX with headers, footers, and page numbers for case11."""
 
-from docx import Document
-from docx.shared import Pt, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn, nsmap
-from docx.oxml import OxmlElement
-
-def add_page_number_field(paragraph):
-    """Insert PAGE field code into a paragraph."""
-    run = paragraph.add_run()
-    fld_char_begin = OxmlElement("w:fldChar")
-    fld_char_begin.set(qn("w:fldCharType"), "begin")
-    run._element.append(fld_char_begin)
-
-    run2 = paragraph.add_run()
-    instr = OxmlElement("w:instrText")
-    instr.set(qn("xml:space"), "preserve")
-    instr.text = " PAGE "
-    run2._element.append(instr)
-
-    run3 = paragraph.add_run()
-    fld_char_end = OxmlElement("w:fldChar")
-    fld_char_end.set(qn("w:fldCharType"), "end")
-    run3._element.append(fld_char_end)
-
-def add_numpages_field(paragraph):
-    """Insert NUMPAGES field code into a paragraph."""
-    run = paragraph.add_run()
-    fld_char_begin = OxmlElement("w:fldChar")
-    fld_char_begin.set(qn("w:fldCharType"), "begin")
-    run._element.append(fld_char_begin)
-
-    run2 = paragraph.add_run()
-    instr = OxmlElement("w:instrText")
-    instr.set(qn("xml:space"), "preserve")
-    instr.text = " NUMPAGES "
-    run2._element.append(instr)
-
-    run3 = paragraph.add_run()
-    fld_char_end = OxmlElement("w:fldChar")
-    fld_char_end.set(qn("w:fldCharType"), "end")
-    run3._element.append(fld_char_end)
-
-doc = Document()
-
-section = doc.sections[0]
-section.page_width = Inches(8.5)
-section.page_height = Inches(11)
-section.top_margin = Inches(1)
-section.bottom_margin = Inches(1)
-section.left_margin = Inches(1)
-section.right_margin = Inches(1)
-section.header_distance = Inches(0.5)
-section.footer_distance = Inches(0.5)
-
-section.different_first_page_header_footer = True
+import zipfile
+from xml.sax.saxutils import escape
 
-# First page header
-first_header = section.first_page_header
-first_header.is_linked_to_previous = False
-p = first_header.paragraphs[0]
-p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-run = p.add_run("CONFIDENTIAL — Draft Report")
-run.bold = True
-run.font.size = Pt(14)
+OUTPUT = "tests/fixtures/case11/input.docx"
 
-# Default header (pages 2+)
-default_header = section.header
-default_header.is_linked_to_previous = False
-p = default_header.paragraphs[0]
-p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-run = p.add_run("Quarterly Report 2025")
-run.font.size = Pt(10)
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+XML_DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
 
-# First page footer
-first_footer = section.first_page_footer
-first_footer.is_linked_to_previous = False
-p = first_footer.paragraphs[0]
-p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-run = p.add_run("Internal Use Only")
-run.font.size = Pt(9)
-
-# Default footer with "Page X of Y"
-default_footer = section.footer
-default_footer.is_linked_to_previous = False
-p = default_footer.paragraphs[0]
-p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-run = p.add_run("Page ")
-run.font.size = Pt(10)
-add_page_number_field(p)
-run = p.add_run(" of ")
-run.font.size = Pt(10)
-add_numpages_field(p)
-
-# Body content - Page 1
-h1 = doc.add_heading("Executive Summary", level=1)
-doc.add_paragraph(
-    "This quarterly report provides a comprehensive overview of our organizational "
-    "performance during Q3 2025. The following sections detail key achievements, "
-    "financial metrics, and strategic initiatives undertaken during this period."
-)
-doc.add_paragraph(
-    "Our team has made significant progress across multiple fronts, including revenue "
-    "growth, customer acquisition, and product development milestones. The data "
-    "presented herein reflects our commitment to transparency and accountability."
+CONTENT_TYPES = XML_DECL + (
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    '<Override PartName="/word/settings.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/>'
+    '<Override PartName="/word/fontTable.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.fontTable+xml"/>'
+    '<Override PartName="/word/theme/theme1.xml" ContentType="application/vnd.openxmlformats-officedocument.theme+xml"/>'
+    '<Override PartName="/word/header1.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.header+xml"/>'
+    '<Override PartName="/word/header2.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.header+xml"/>'
+    '<Override PartName="/word/footer1.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.footer+xml"/>'
+    '<Override PartName="/word/footer2.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.footer+xml"/>'
+    "</Types>"
 )
 
-h2 = doc.add_heading("Financial Highlights", level=2)
-doc.add_paragraph(
-    "Revenue increased by 23% year-over-year, driven primarily by expansion into new "
-    "markets and the successful launch of our premium service tier. Operating margins "
-    "improved to 18.5%, up from 15.2% in the previous quarter."
-)
-doc.add_paragraph(
-    "Customer acquisition costs decreased by 12% while lifetime value increased by "
-    "8%, indicating improved efficiency in our marketing and sales operations. These "
-    "trends are expected to continue into the next fiscal year."
+PACKAGE_RELS = XML_DECL + (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+    "</Relationships>"
 )
 
-# More content to push onto page 2
-doc.add_heading("Operational Review", level=2)
-doc.add_paragraph(
-    "Infrastructure investments totaling $4.2 million were completed on schedule and "
-    "under budget. System uptime averaged 99.97% across all production environments, "
-    "exceeding our target of 99.95%. The engineering team deployed 847 production "
-    "releases during the quarter, a 34% increase from Q2."
-)
-doc.add_paragraph(
-    "Employee satisfaction scores reached an all-time high of 4.6 out of 5.0, driven "
-    "by new benefits programs and flexible work arrangements. Voluntary turnover "
-    "decreased to 6.2%, well below the industry average of 13.5%."
+DOCUMENT_RELS = XML_DECL + (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/header" Target="header1.xml"/>'
+    '<Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/header" Target="header2.xml"/>'
+    '<Relationship Id="rId4" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/footer" Target="footer1.xml"/>'
+    '<Relationship Id="rId5" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/footer" Target="footer2.xml"/>'
+    '<Relationship Id="rId6" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/settings" Target="settings.xml"/>'
+    '<Relationship Id="rId7" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/fontTable" Target="fontTable.xml"/>'
+    '<Relationship Id="rId8" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme" Target="theme/theme1.xml"/>'
+    "</Relationships>"
 )
 
-doc.add_heading("Market Analysis", level=2)
-doc.add_paragraph(
-    "The competitive landscape continued to evolve during Q3, with several new entrants "
-    "in our primary market segment. Despite increased competition, we maintained our "
-    "market share at 28.3% and expanded our presence in the enterprise segment by 15%. "
-    "Our brand recognition surveys indicate strong positioning among target demographics."
-)
-doc.add_paragraph(
-    "International expansion efforts yielded promising results, with our EMEA region "
-    "growing 31% and APAC growing 28%. Strategic partnerships established during the "
-    "quarter are expected to accelerate growth in these regions through 2026."
-)
+# Fonts come from the theme as in the python-docx default template:
+# minorFont (body) is Cambria, majorFont (headings) is Calibri.
+MINOR_FONTS = ('<w:rFonts w:asciiTheme="minorHAnsi" w:eastAsiaTheme="minorEastAsia" '
+               'w:hAnsiTheme="minorHAnsi" w:cstheme="minorBidi"/>')
+MAJOR_FONTS = ('<w:rFonts w:asciiTheme="majorHAnsi" w:eastAsiaTheme="majorEastAsia" '
+               'w:hAnsiTheme="majorHAnsi" w:cstheme="majorBidi"/>')
 
-# Page 2/3 content
-doc.add_heading("Strategic Initiatives", level=1)
-doc.add_paragraph(
-    "Several key strategic initiatives were launched during Q3 to position the company "
-    "for long-term growth and market leadership. These initiatives span technology, "
-    "talent, and market development dimensions."
+STYLES = XML_DECL + (
+    f'<w:styles xmlns:w="{W_NS}">'
+    "<w:docDefaults>"
+    f"<w:rPrDefault><w:rPr>{MINOR_FONTS}"
+    '<w:sz w:val="22"/><w:szCs w:val="22"/><w:lang w:val="en-US"/></w:rPr></w:rPrDefault>'
+    '<w:pPrDefault><w:pPr><w:spacing w:after="200" w:line="276" w:lineRule="auto"/></w:pPr></w:pPrDefault>'
+    "</w:docDefaults>"
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/><w:qFormat/></w:style>'
+    '<w:style w:type="character" w:default="1" w:styleId="DefaultParagraphFont"><w:name w:val="Default Paragraph Font"/></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/><w:basedOn w:val="Normal"/>'
+    '<w:next w:val="Normal"/><w:qFormat/>'
+    '<w:pPr><w:keepNext/><w:keepLines/><w:spacing w:before="480" w:after="0"/><w:outlineLvl w:val="0"/></w:pPr>'
+    f"<w:rPr>{MAJOR_FONTS}"
+    '<w:b/><w:bCs/><w:color w:val="365F91" w:themeColor="accent1" w:themeShade="BF"/>'
+    '<w:sz w:val="28"/><w:szCs w:val="28"/></w:rPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading2"><w:name w:val="heading 2"/><w:basedOn w:val="Normal"/>'
+    '<w:next w:val="Normal"/><w:qFormat/>'
+    '<w:pPr><w:keepNext/><w:keepLines/><w:spacing w:before="200" w:after="0"/><w:outlineLvl w:val="1"/></w:pPr>'
+    f"<w:rPr>{MAJOR_FONTS}"
+    '<w:b/><w:bCs/><w:color w:val="4F81BD" w:themeColor="accent1"/>'
+    '<w:sz w:val="26"/><w:szCs w:val="26"/></w:rPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Header"><w:name w:val="header"/><w:basedOn w:val="Normal"/>'
+    '<w:pPr><w:tabs><w:tab w:val="center" w:pos="4680"/><w:tab w:val="right" w:pos="9360"/></w:tabs>'
+    '<w:spacing w:after="0" w:line="240" w:lineRule="auto"/></w:pPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Footer"><w:name w:val="footer"/><w:basedOn w:val="Normal"/>'
+    '<w:pPr><w:tabs><w:tab w:val="center" w:pos="4680"/><w:tab w:val="right" w:pos="9360"/></w:tabs>'
+    '<w:spacing w:after="0" w:line="240" w:lineRule="auto"/></w:pPr></w:style>'
+    "</w:styles>"
 )
-doc.add_heading("Technology Roadmap", level=2)
-doc.add_paragraph(
-    "The next-generation platform architecture entered beta testing with select "
-    "enterprise customers. Early feedback has been overwhelmingly positive, with "
-    "participants reporting 40% faster processing times and improved ease of use. "
-    "General availability is targeted for Q1 2026."
+
+# Word 2010 compatibility mode, as in the template the reference was made from.
+SETTINGS = XML_DECL + (
+    f'<w:settings xmlns:w="{W_NS}">'
+    '<w:defaultTabStop w:val="720"/>'
+    '<w:characterSpacingControl w:val="doNotCompress"/>'
+    "<w:compat>"
+    '<w:compatSetting w:name="compatibilityMode" w:uri="http://schemas.microsoft.com/office/word" w:val="14"/>'
+    "</w:compat>"
+    '<w:themeFontLang w:val="en-US"/>'
+    "</w:settings>"
 )
-doc.add_paragraph(
-    "Our AI and machine learning capabilities were significantly enhanced through "
-    "both internal development and strategic acquisitions. The integration of advanced "
-    "natural language processing models into our product suite has opened new use cases "
-    "and revenue streams that were previously inaccessible."
+
+FONT_TABLE = XML_DECL + (
+    f'<w:fonts xmlns:w="{W_NS}">'
+    '<w:font w:name="Cambria"><w:panose1 w:val="02040503050406030204"/>'
+    '<w:charset w:val="00"/><w:family w:val="roman"/><w:pitch w:val="variable"/></w:font>'
+    '<w:font w:name="Calibri"><w:panose1 w:val="020F0502020204030204"/>'
+    '<w:charset w:val="00"/><w:family w:val="swiss"/><w:pitch w:val="variable"/></w:font>'
+    "</w:fonts>"
 )
-doc.add_heading("Talent Development", level=2)
-doc.add_paragraph(
-    "A comprehensive leadership development program was launched for mid-level managers, "
-    "with 85 participants enrolled in the first cohort. Early assessments show "
-    "measurable improvements in team performance metrics and employee engagement scores "
-    "within participating departments."
+
+# Minimal "Office" theme: the template's colour and font schemes, solid-fill format scheme.
+THEME = XML_DECL + (
+    '<a:theme xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" name="Office Theme">'
+    "<a:themeElements>"
+    '<a:clrScheme name="Office">'
+    '<a:dk1><a:sysClr val="windowText" lastClr="000000"/></a:dk1>'
+    '<a:lt1><a:sysClr val="window" lastClr="FFFFFF"/></a:lt1>'
+    '<a:dk2><a:srgbClr val="1F497D"/></a:dk2><a:lt2><a:srgbClr val="EEECE1"/></a:lt2>'
+    '<a:accent1><a:srgbClr val="4F81BD"/></a:accent1><a:accent2><a:srgbClr val="C0504D"/></a:accent2>'
+    '<a:accent3><a:srgbClr val="9BBB59"/></a:accent3><a:accent4><a:srgbClr val="8064A2"/></a:accent4>'
+    '<a:accent5><a:srgbClr val="4BACC6"/></a:accent5><a:accent6><a:srgbClr val="F79646"/></a:accent6>'
+    '<a:hlink><a:srgbClr val="0000FF"/></a:hlink><a:folHlink><a:srgbClr val="800080"/></a:folHlink>'
+    "</a:clrScheme>"
+    '<a:fontScheme name="Office">'
+    '<a:majorFont><a:latin typeface="Calibri"/><a:ea typeface=""/><a:cs typeface=""/></a:majorFont>'
+    '<a:minorFont><a:latin typeface="Cambria"/><a:ea typeface=""/><a:cs typeface=""/></a:minorFont>'
+    "</a:fontScheme>"
+    '<a:fmtScheme name="Office">'
+    "<a:fillStyleLst>" + '<a:solidFill><a:schemeClr val="phClr"/></a:solidFill>' * 3 + "</a:fillStyleLst>"
+    "<a:lnStyleLst>" + '<a:ln w="9525"><a:solidFill><a:schemeClr val="phClr"/></a:solidFill></a:ln>' * 3
+    + "</a:lnStyleLst>"
+    "<a:effectStyleLst>" + "<a:effectStyle><a:effectLst/></a:effectStyle>" * 3 + "</a:effectStyleLst>"
+    "<a:bgFillStyleLst>" + '<a:solidFill><a:schemeClr val="phClr"/></a:solidFill>' * 3 + "</a:bgFillStyleLst>"
+    "</a:fmtScheme>"
+    "</a:themeElements>"
+    "</a:theme>"
 )
-doc.add_paragraph(
-    "Technical hiring continued at pace, with 127 new engineers joining during Q3. "
-    "Our revised interview process resulted in a 23% improvement in offer acceptance "
-    "rates and a more diverse candidate pipeline. Diversity metrics improved across all "
-    "categories, with women in technical roles increasing from 32% to 36%."
+
+
+def run(text, rpr=""):
+    """A text run with optional raw run properties."""
+    rpr = f"<w:rPr>{rpr}</w:rPr>" if rpr else ""
+    return f'<w:r>{rpr}<w:t xml:space="preserve">{escape(text)}</w:t></w:r>'
+
+
+def field(instr_text):
+    """A simple field (e.g. PAGE, NUMPAGES) as a single run."""
+    return (
+        '<w:r><w:fldChar w:fldCharType="begin"/>'
+        f'<w:instrText xml:space="preserve">{instr_text}</w:instrText>'
+        '<w:fldChar w:fldCharType="end"/></w:r>'
+    )
+
+
+def header_footer(tag, style, jc, runs):
+    """A header (hdr) or footer (ftr) part holding a single paragraph."""
+    return XML_DECL + (
+        f'<w:{tag} xmlns:w="{W_NS}" xmlns:r="{R_NS}">'
+        f'<w:p><w:pPr><w:pStyle w:val="{style}"/><w:jc w:val="{jc}"/></w:pPr>{"".join(runs)}</w:p>'
+        f"</w:{tag}>"
+    )
+
+
+# Shared run properties for header/footer text. Kept as direct formatting
+# rather than character styles: the converter does not resolve w:rStyle.
+TITLE_14PT_BOLD = '<w:b/><w:sz w:val="28"/>'
+SIZE_10PT = '<w:sz w:val="20"/>'
+SIZE_9PT = '<w:sz w:val="18"/>'
+
+# First page header
+FIRST_HEADER = header_footer(
+    "hdr", "Header", "center",
+    [run("CONFIDENTIAL — Draft Report", TITLE_14PT_BOLD)],
 )
 
-doc.add_heading("Risk Assessment and Mitigation", level=2)
-doc.add_paragraph(
-    "Key risks identified during the quarter include regulatory changes in our primary "
-    "markets, potential supply chain disruptions, and cybersecurity threats. Mitigation "
-    "strategies have been developed and approved by the board for each identified risk "
-    "category. Our enterprise risk management framework continues to mature, with "
-    "quarterly reviews ensuring alignment with evolving business conditions."
+# Default header (pages 2+)
+DEFAULT_HEADER = header_footer(
+    "hdr", "Header", "left",
+    [run("Quarterly Report 2025", SIZE_10PT)],
 )
-doc.add_paragraph(
-    "The compliance team completed a comprehensive audit of all operational processes, "
-    "resulting in 14 recommendations for improvement. All critical findings have been "
-    "addressed, with remaining items on track for completion by end of Q4."
+
+# First page footer
+FIRST_FOOTER = header_footer(
+    "ftr", "Footer", "center",
+    [run("Internal Use Only", SIZE_9PT)],
 )
 
-doc.add_heading("Looking Ahead", level=1)
-doc.add_paragraph(
-    "As we enter Q4 2025, our focus shifts to executing on the strategic priorities "
-    "established during the annual planning cycle. Key objectives include achieving "
-    "full-year revenue targets, completing the platform migration, and establishing "
-    "market presence in three additional geographic regions."
+# Default footer with "Page X of Y"
+DEFAULT_FOOTER = header_footer(
+    "ftr", "Footer", "center",
+    [
+        run("Page ", SIZE_10PT),
+        field(" PAGE "),
+        run(" of ", SIZE_10PT),
+        field(" NUMPAGES "),
+    ],
 )
-doc.add_paragraph(
-    "The executive team remains confident in our ability to deliver on these objectives "
-    "while maintaining the operational excellence that has characterized our recent "
-    "performance. We look forward to reporting continued progress in our Q4 review."
+
+H1 = "Heading1"
+H2 = "Heading2"
+
+# Body content as (style, text); style None means Normal.
+BODY = [
+    # Page 1
+    (H1, "Executive Summary"),
+    (None,
+     "This quarterly report provides a comprehensive overview of our organizational "
+     "performance during Q3 2025. The following sections detail key achievements, "
+     "financial metrics, and strategic initiatives undertaken during this period."),
+    (None,
+     "Our team has made significant progress across multiple fronts, including revenue "
+     "growth, customer acquisition, and product development milestones. The data "
+     "presented herein reflects our commitment to transparency and accountability."),
+    (H2, "Financial Highlights"),
+    (None,
+     "Revenue increased by 23% year-over-year, driven primarily by expansion into new "
+     "markets and the successful launch of our premium service tier. Operating margins "
+     "improved to 18.5%, up from 15.2% in the previous quarter."),
+    (None,
+     "Customer acquisition costs decreased by 12% while lifetime value increased by "
+     "8%, indicating improved efficiency in our marketing and sales operations. These "
+     "trends are expected to continue into the next fiscal year."),
+    # More content to push onto page 2
+    (H2, "Operational Review"),
+    (None,
+     "Infrastructure investments totaling $4.2 million were completed on schedule and "
+     "under budget. System uptime averaged 99.97% across all production environments, "
+     "exceeding our target of 99.95%. The engineering team deployed 847 production "
+     "releases during the quarter, a 34% increase from Q2."),
+    (None,
+     "Employee satisfaction scores reached an all-time high of 4.6 out of 5.0, driven "
+     "by new benefits programs and flexible work arrangements. Voluntary turnover "
+     "decreased to 6.2%, well below the industry average of 13.5%."),
+    (H2, "Market Analysis"),
+    (None,
+     "The competitive landscape continued to evolve during Q3, with several new entrants "
+     "in our primary market segment. Despite increased competition, we maintained our "
+     "market share at 28.3% and expanded our presence in the enterprise segment by 15%. "
+     "Our brand recognition surveys indicate strong positioning among target demographics."),
+    (None,
+     "International expansion efforts yielded promising results, with our EMEA region "
+     "growing 31% and APAC growing 28%. Strategic partnerships established during the "
+     "quarter are expected to accelerate growth in these regions through 2026."),
+    # Page 2/3 content
+    (H1, "Strategic Initiatives"),
+    (None,
+     "Several key strategic initiatives were launched during Q3 to position the company "
+     "for long-term growth and market leadership. These initiatives span technology, "
+     "talent, and market development dimensions."),
+    (H2, "Technology Roadmap"),
+    (None,
+     "The next-generation platform architecture entered beta testing with select "
+     "enterprise customers. Early feedback has been overwhelmingly positive, with "
+     "participants reporting 40% faster processing times and improved ease of use. "
+     "General availability is targeted for Q1 2026."),
+    (None,
+     "Our AI and machine learning capabilities were significantly enhanced through "
+     "both internal development and strategic acquisitions. The integration of advanced "
+     "natural language processing models into our product suite has opened new use cases "
+     "and revenue streams that were previously inaccessible."),
+    (H2, "Talent Development"),
+    (None,
+     "A comprehensive leadership development program was launched for mid-level managers, "
+     "with 85 participants enrolled in the first cohort. Early assessments show "
+     "measurable improvements in team performance metrics and employee engagement scores "
+     "within participating departments."),
+    (None,
+     "Technical hiring continued at pace, with 127 new engineers joining during Q3. "
+     "Our revised interview process resulted in a 23% improvement in offer acceptance "
+     "rates and a more diverse candidate pipeline. Diversity metrics improved across all "
+     "categories, with women in technical roles increasing from 32% to 36%."),
+    (H2, "Risk Assessment and Mitigation"),
+    (None,
+     "Key risks identified during the quarter include regulatory changes in our primary "
+     "markets, potential supply chain disruptions, and cybersecurity threats. Mitigation "
+     "strategies have been developed and approved by the board for each identified risk "
+     "category. Our enterprise risk management framework continues to mature, with "
+     "quarterly reviews ensuring alignment with evolving business conditions."),
+    (None,
+     "The compliance team completed a comprehensive audit of all operational processes, "
+     "resulting in 14 recommendations for improvement. All critical findings have been "
+     "addressed, with remaining items on track for completion by end of Q4."),
+    (H1, "Looking Ahead"),
+    (None,
+     "As we enter Q4 2025, our focus shifts to executing on the strategic priorities "
+     "established during the annual planning cycle. Key objectives include achieving "
+     "full-year revenue targets, completing the platform migration, and establishing "
+     "market presence in three additional geographic regions."),
+    (None,
+     "The executive team remains confident in our ability to deliver on these objectives "
+     "while maintaining the operational excellence that has characterized our recent "
+     "performance. We look forward to reporting continued progress in our Q4 review."),
+]
+
+
+def paragraph(style, text):
+    ppr = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    return f"<w:p>{ppr}<w:r><w:t>{escape(text)}</w:t></w:r></w:p>"
+
+
+# Letter, 1" margins, 0.5" header/footer distance, different first page.
+SECT_PR = (
+    "<w:sectPr>"
+    '<w:headerReference w:type="first" r:id="rId2"/>'
+    '<w:headerReference w:type="default" r:id="rId3"/>'
+    '<w:footerReference w:type="first" r:id="rId4"/>'
+    '<w:footerReference w:type="default" r:id="rId5"/>'
+    '<w:pgSz w:w="12240" w:h="15840"/>'
+    '<w:pgMar w:top="1440" w:right="1440" w:bottom="1440" w:left="1440" '
+    'w:header="720" w:footer="720" w:gutter="0"/>'
+    '<w:cols w:space="720"/><w:titlePg/><w:docGrid w:linePitch="360"/>'
+    "</w:sectPr>"
 )
 
-doc.save("tests/fixtures/case11/input.docx")
-print("Generated tests/fixtures/case11/input.docx")
+# Whole body rendered in one join; sectPr must stay the last child.
+BODY_XML = "".join(["<w:body>", *(paragraph(s, t) for s, t in BODY), SECT_PR, "</w:body>"])
+
+DOCUMENT = XML_DECL + f'<w:document xmlns:w="{W_NS}" xmlns:r="{R_NS}">{BODY_XML}</w:document>'
+
+PARTS = {
+    "[Content_Types].xml": CONTENT_TYPES,
+    "_rels/.rels": PACKAGE_RELS,
+    "word/_rels/document.xml.rels": DOCUMENT_RELS,
+    "word/document.xml": DOCUMENT,
+    "word/styles.xml": STYLES,
+    "word/settings.xml": SETTINGS,
+    "word/fontTable.xml": FONT_TABLE,
+    "word/theme/theme1.xml": THEME,
+    "word/header1.xml": FIRST_HEADER,
+    "word/header2.xml": DEFAULT_HEADER,
+    "word/footer1.xml": FIRST_FOOTER,
+    "word/footer2.xml": DEFAULT_FOOTER,
+}
+
+with zipfile.ZipFile(OUTPUT, "w", zipfile.ZIP_DEFLATED) as zf:
+    for name, xml in PARTS.items():
+        zf.writestr(name, xml)
+
+print(f"Generated {OUTPUT}")
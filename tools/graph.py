@@ -1,12 +1,19 @@
 #!/usr/bin/env python3
 import subprocess
 from datetime import timedelta
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import sys
 from pathlib import Path
 
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
 root = Path(__file__).parent.parent
 
 jaccard_csv = root / "tests/output/results.csv"
@@ -17,87 +24,174 @@ if not jaccard_csv.exists() and not ssim_csv.exists():
     sys.exit(1)
 
 
+_commit_cache = {"head": None, "commits": []}
+
+
 def load_commits():
+    head = subprocess.check_output(
+        ["git", "rev-parse", "HEAD"],
+        cwd=root,
+        text=True,
+    ).strip()
+    if head == _commit_cache["head"]:
+        return _commit_cache["commits"]
+
     log = subprocess.check_output(
-        ["git", "log", "--pretty=format:%at\t%s"],
+        ["git", "log", "--reverse", "--author-date-order", "-z", "--pretty=format:%at\t%s"],
         cwd=root,
         text=True,
     )
-    commits = []
-    for line in log.splitlines():
-        ts, _, msg = line.partition("\t")
-        commits.append((pd.to_datetime(int(ts), unit="s"), msg))
-    commits.sort(key=lambda c: c[0])
+    parts = [entry.partition("\t") for entry in log.split("\x00") if entry]
+    ts = np.fromiter((int(p[0]) for p in parts), dtype=np.int64, count=len(parts))
+    times = pd.to_datetime(ts, unit="s")
+    commits = list(zip(times, (p[2] for p in parts)))
+    _commit_cache["head"] = head
+    _commit_cache["commits"] = commits
     return commits
 
 
+_csv_cache = {}
+
+
+def _read_cached(path, score_col):
+    mtime = path.stat().st_mtime_ns
+    cached = _csv_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    df = pd.read_csv(
+        path,
+        usecols=["timestamp", "case", score_col],
+        dtype={"timestamp": "int64", "case": "category", score_col: "float32"},
+        engine=CSV_ENGINE,
+    )
+    df["time"] = pd.to_datetime(df["timestamp"], unit="s")
+    _csv_cache[path] = (mtime, df)
+    return df
+
+
+# Everything that changes between ticks is animated (blitted over a cached
+# background); axes, ticks and threshold lines only redraw when limits move.
+_case_lines = {}
+_commit_artists = {}
+_legends = {}
+
+
+def animated_artists():
+    artists = [line for lines in _case_lines.values() for line in lines.values()]
+    for commit_artists, _, _ in _commit_artists.values():
+        for vline, text in commit_artists.values():
+            artists += [vline, text]
+    artists += _legends.values()
+    return artists
+
+
 def draw_commits(ax, commits):
+    artists, drawn, drawn_top = _commit_artists.get(ax, ({}, None, None))
     y_top = ax.get_ylim()[1]
-    for i, (t, msg) in enumerate(commits):
-        ax.axvline(t, color="gray", linewidth=0.6, alpha=0.35, linestyle="--")
-        y_pos = y_top * (0.97 - 0.10 * (i % 4))
-        ax.text(t, y_pos, msg, rotation=90, fontsize=6.5,
-                va="top", ha="right", color="gray", alpha=0.55)
-
+    if commits is drawn and y_top == drawn_top:
+        return
 
-num_plots = int(jaccard_csv.exists()) + int(ssim_csv.exists())
-fig, axes = plt.subplots(1, num_plots, figsize=(12 * num_plots, 6), squeeze=False)
+    if commits is not drawn:
+        current = set(commits)
+        for key, (vline, text) in artists.items():
+            vline.set_visible(key in current)
+            text.set_visible(key in current)
+    for i, key in enumerate(commits):
+        t, msg = key
+        if key not in artists:
+            artists[key] = (
+                ax.axvline(t, color="gray", linewidth=0.6, alpha=0.35, linestyle="--",
+                           animated=True),
+                # Clipped so blitting, which only restores ax.bbox, erases it.
+                ax.text(t, 0, msg, rotation=90, fontsize=6.5, animated=True, clip_on=True,
+                        va="top", ha="right", color="gray", alpha=0.55),
+            )
+        artists[key][1].set_position((t, y_top * (0.97 - 0.10 * (i % 4))))
+    _commit_artists[ax] = (artists, commits, y_top)
+
+
+def plot_scores(ax, df, col):
+    lines = _case_lines.setdefault(ax, {})
+    added = False
+    t = df["time"].to_numpy()
+    pct = df[col].to_numpy() * 100
+    for case, idx in df.groupby("case", observed=True).indices.items():
+        x, y = t[idx], pct[idx]
+        line = lines.get(case)
+        if line is None:
+            (lines[case],) = ax.plot(x, y, marker="o", label=case, animated=True)
+            added = True
+        else:
+            line.set_data(x, y)
+    ax.relim()
+    ax.autoscale_view(scalex=False)
+    if added:
+        _legends[ax] = ax.legend()
+        _legends[ax].set_animated(True)
+
+
+# (csv, score column, threshold %, y label, title) for each available plot.
+panels = [
+    panel for panel in [
+        (jaccard_csv, "avg_jaccard", 25, "Jaccard similarity (%)", "Jaccard similarity over time"),
+        (ssim_csv, "avg_ssim", 40, "SSIM (%)", "SSIM over time"),
+    ]
+    if panel[0].exists()
+]
+fig, axes = plt.subplots(1, len(panels), figsize=(12 * len(panels), 6), squeeze=False)
+
+for ax, (_, _, threshold, ylabel, title) in zip(axes[0], panels):
+    ax.axhline(threshold, linestyle="--", color="gray", linewidth=1,
+               label=f"threshold ({threshold}%)")
+    ax.set_ylabel(ylabel)
+    ax.set_xlabel("Time")
+    ax.set_title(title)
+
+
+_xlims = {}
 
 
 def redraw(_frame=None):
     commits = load_commits()
     if not commits:
-        return
+        return animated_artists()
 
-    data_times = []
-    for p, col in [(jaccard_csv, "avg_jaccard"), (ssim_csv, "avg_ssim")]:
+    frames = {}
+    for p, col, *_ in panels:
         if p.exists():
-            tmp = pd.read_csv(p)
-            data_times.extend(pd.to_datetime(tmp["timestamp"], unit="s").tolist())
+            frames[p] = _read_cached(p, col)
 
-    t_first = min(data_times) if data_times else commits[0][0]
+    data_starts = [df["time"].min() for df in frames.values() if not df.empty]
+    t_first = min(data_starts) if data_starts else commits[0][0]
     t_last = commits[-1][0]
     padding = (t_last - t_first) * 0.03 or timedelta(minutes=5)
 
-    plot_idx = 0
-
-    if jaccard_csv.exists():
-        df = pd.read_csv(jaccard_csv)
-        df["time"] = pd.to_datetime(df["timestamp"], unit="s")
-        ax = axes[0][plot_idx]
-        ax.cla()
-        for case, g in df.groupby("case"):
-            ax.plot(g["time"], g["avg_jaccard"] * 100, marker="o", label=case)
-        ax.axhline(25, linestyle="--", color="gray", linewidth=1, label="threshold (25%)")
-        t_right = max(t_last + timedelta(hours=2), df["time"].max() + padding)
-        ax.set_xlim(t_first - padding, t_right)
-        draw_commits(ax, commits)
-        ax.set_ylabel("Jaccard similarity (%)")
-        ax.set_xlabel("Time")
-        ax.set_title("Jaccard similarity over time")
-        ax.legend()
-        plot_idx += 1
-
-    if ssim_csv.exists():
-        df = pd.read_csv(ssim_csv)
-        df["time"] = pd.to_datetime(df["timestamp"], unit="s")
-        ax = axes[0][plot_idx]
-        ax.cla()
-        for case, g in df.groupby("case"):
-            ax.plot(g["time"], g["avg_ssim"] * 100, marker="o", label=case)
-        ax.axhline(40, linestyle="--", color="gray", linewidth=1, label="threshold (40%)")
+    relayout = False
+    for ax, (p, col, *_) in zip(axes[0], panels):
+        if p not in frames:
+            continue
+        df = frames[p]
+        view = (ax.get_xlim(), ax.get_ylim())
+        plot_scores(ax, df, col)
         t_right = max(t_last + timedelta(hours=2), df["time"].max() + padding)
-        ax.set_xlim(t_first - padding, t_right)
+        xlim = (t_first - padding, t_right)
+        if _xlims.get(ax) != xlim:
+            ax.set_xlim(*xlim)
+            _xlims[ax] = xlim
         draw_commits(ax, commits)
-        ax.set_ylabel("SSIM (%)")
-        ax.set_xlabel("Time")
-        ax.set_title("SSIM over time")
-        ax.legend()
+        relayout |= view != (ax.get_xlim(), ax.get_ylim())
 
-    fig.autofmt_xdate()
-    fig.tight_layout()
+    # New limits invalidate the blit background: redraw ticks and labels
+    # now so the animation re-caches it for the new view.
+    if relayout:
+        fig.autofmt_xdate()
+        fig.tight_layout()
+        fig.canvas.draw()
+    return animated_artists()
 
 
 redraw()
-ani = animation.FuncAnimation(fig, redraw, interval=3000, cache_frame_data=False)
+ani = animation.FuncAnimation(fig, redraw, init_func=animated_artists, interval=3000,
+                              blit=True, cache_frame_data=False)
 plt.show()